@@ -1,14 +1,19 @@
 import pandas as pd  
+import streamlit as st
 
+@st.cache_data(show_spinner=False)
 def load_equipment_data(filepath="data/equipment.csv"):
     """Loads equipment details."""
     return pd.read_csv(filepath)
 
-def process_fuel_data(filepath="data/fuel_usage.csv"):
-    """Processes fuel usage logs."""
-    df = pd.read_csv(filepath)
-    df["Date"] = pd.to_datetime(df["Date"])
-    return df
+@st.cache_data(show_spinner=False)
+def process_fuel_data(filepath="data/fuel_usage.csv", usecols=None, dtype=None):
+    """
+    Processes fuel usage logs; usecols/dtype narrow the parse when the schema
+    is known. Date is parsed as datetimes whenever it is among the columns read.
+    """
+    parse_dates = ["Date"] if usecols is None or "Date" in usecols else None
+    return pd.read_csv(filepath, usecols=usecols, dtype=dtype, parse_dates=parse_dates)
 
 if __name__ == "__main__":
     equip_data = load_equipment_data()
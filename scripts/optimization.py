@@ -1,6 +1,8 @@
+import functools
+import inspect
+import math
+from dataclasses import dataclass
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Operation-specific fuel consumption data (L/ha at reference speed)
@@ -70,6 +72,40 @@ OPERATION_FUEL_DATA = {
     },
 }
 
+# (base, reference_speed) per operation, extracted once for the fuel model
+_OP_PARAMS = {
+    op: (data["base"], data["reference_speed"])
+    for op, data in OPERATION_FUEL_DATA.items()
+}
+
+@functools.lru_cache(maxsize=1)
+def _fuel_table():
+    """
+    Reference table shown in the UI; built once since OPERATION_FUEL_DATA is
+    constant. pandas is imported here so importing this module stays light.
+    """
+    import pandas as pd
+    return pd.DataFrame([
+        {
+            "Operation": op,
+            "Fuel Range (L/ha)": data["range"],
+            "Base (L/ha)": data["base"],
+            "Reference Speed (km/h)": data["reference_speed"],
+            "Typical Speed Range (km/h)": data["speed_range"],
+            "Remarks": data["remarks"]
+        }
+        for op, data in OPERATION_FUEL_DATA.items()
+    ])
+
+# Sidebar summary for each operation, rendered once rather than on every rerun
+_OP_INFO_STRINGS = {
+    op: (f"📊 **Fuel range:** {data['range']} L/ha\n\n"
+         f"⚙️ **Reference speed:** {data['reference_speed']} km/hr\n\n"
+         f"🎯 **Recommended speed:** {data['speed_range']} km/hr\n\n"
+         f"💡 *{data['remarks']}*")
+    for op, data in OPERATION_FUEL_DATA.items()
+}
+
 def calculate_fuel_consumption(operation_type, operating_speed):
     """
     Calculate fuel consumption per hectare based on operation type and speed.
@@ -81,16 +117,20 @@ def calculate_fuel_consumption(operation_type, operating_speed):
     Returns:
         Fuel consumption in liters per hectare
     """
-    operation_data = OPERATION_FUEL_DATA[operation_type]
-    base_consumption = operation_data["base"]
-    reference_speed = operation_data["reference_speed"]
+    base_consumption, reference_speed = _OP_PARAMS[operation_type]
     
-    # Speed factor: fuel increases with speed (1.5 exponent for resistance)
-    speed_factor = (operating_speed / reference_speed) ** 1.5
+    # Speed factor: fuel increases with speed (1.5 exponent for resistance),
+    # evaluated as ratio * sqrt(ratio) rather than a generic pow
+    speed_ratio = operating_speed / reference_speed
+    speed_factor = speed_ratio * math.sqrt(speed_ratio)
     fuel_per_hectare = base_consumption * speed_factor
     
     return fuel_per_hectare
 
+def _capacity_coeff(implement_width, field_efficiency):
+    """Field capacity per tractor (ha/hr) for each km/hr of operating speed."""
+    return (implement_width * field_efficiency) / 10
+
 def calculate_farm_metrics(tractor_count, operating_speed, working_hours, 
                           implement_width, field_efficiency, fuel_cost_per_liter,
                           operation_type):
@@ -101,7 +141,7 @@ def calculate_farm_metrics(tractor_count, operating_speed, working_hours,
         Dictionary with calculated metrics for FULL DAY operation
     """
     # Capacity calculations
-    hourly_capacity_per_tractor = (operating_speed * implement_width * field_efficiency) / 10
+    hourly_capacity_per_tractor = operating_speed * _capacity_coeff(implement_width, field_efficiency)
     daily_capacity_per_tractor = hourly_capacity_per_tractor * working_hours
     total_daily_capacity = daily_capacity_per_tractor * tractor_count
     
@@ -123,110 +163,269 @@ def calculate_farm_metrics(tractor_count, operating_speed, working_hours,
         "cost_per_hectare": cost_per_hectare
     }
 
+@dataclass
+class SweepResult:
+    """
+    Per-speed metrics from find_optimal_speed, kept as parallel NumPy arrays.
+    
+    optimal_idx indexes the cheapest feasible speed, or max_speed when
+    status is "infeasible".
+    """
+    status: str
+    optimal_idx: int
+    speeds: np.ndarray
+    can_complete: np.ndarray
+    time_required_hours: np.ndarray
+    fuel_required: np.ndarray
+    total_cost: np.ndarray
+    cost_per_hectare: np.ndarray
+    total_hourly_capacity: np.ndarray
+    total_daily_capacity: np.ndarray
+    fuel_per_hectare: np.ndarray
+    
+    @property
+    def optimal_speed(self):
+        return self.speeds[self.optimal_idx].item() if self.status == "optimal" else None
+    
+    @property
+    def optimal_metrics(self):
+        """Metrics at the optimal speed as a plain dict, or None if infeasible."""
+        if self.status != "optimal":
+            return None
+        return {name: values[self.optimal_idx].item() for name, values in self._columns().items()}
+    
+    def _columns(self):
+        return {
+            "speed": self.speeds,
+            "can_complete": self.can_complete,
+            "time_required_hours": self.time_required_hours,
+            "fuel_required": self.fuel_required,
+            "total_cost": self.total_cost,
+            "cost_per_hectare": self.cost_per_hectare,
+            "total_hourly_capacity": self.total_hourly_capacity,
+            "total_daily_capacity": self.total_daily_capacity,
+            "fuel_per_hectare": self.fuel_per_hectare
+        }
+    
+    def to_dataframe(self):
+        """Full sweep as a DataFrame, one row per speed."""
+        import pandas as pd
+        return pd.DataFrame({
+            **self._columns(),
+            "area_achievable": np.where(self.can_complete, np.nan, self.total_daily_capacity)
+        })
+
+# _sweep_metrics looks prange up by name: plain range when it runs as Python,
+# rebound to numba.prange by _sweep_kernels before compiling
+prange = range
+
+def _sweep_metrics(speeds, base_consumption, reference_speed, tractor_count, working_hours,
+                   capacity_coeff, target_hectares, fuel_cost_per_liter):
+    """
+    Per-speed metrics for find_optimal_speed, filled in a single pass.
+    Compiled by _sweep_kernels as a serial and a multi-threaded kernel; short
+    sweeps call it as plain Python, where prange is just range.
+    
+    Returns:
+        Tuple of arrays (can_complete, time_required, fuel_required, total_cost,
+        cost_per_hectare, total_hourly_capacity, total_daily_capacity, fuel_per_hectare)
+    """
+    n = speeds.shape[0]
+    fleet_coeff = capacity_coeff * tractor_count
+    can_complete = np.empty(n, dtype=np.bool_)
+    time_required = np.empty(n)
+    fuel_required = np.empty(n)
+    total_cost = np.empty(n)
+    cost_per_hectare = np.empty(n)
+    total_hourly_capacity = np.empty(n)
+    total_daily_capacity = np.empty(n)
+    fuel_per_hectare = np.empty(n)
+    
+    for i in prange(n):
+        speed = speeds[i]
+        hourly = speed * fleet_coeff
+        daily = hourly * working_hours
+        speed_ratio = speed / reference_speed
+        fuel_rate = base_consumption * speed_ratio * math.sqrt(speed_ratio)
+        
+        if daily >= target_hectares:
+            # Time and fuel needed for the target area
+            can_complete[i] = True
+            time_required[i] = target_hectares / hourly
+            fuel_required[i] = fuel_rate * target_hectares
+            total_cost[i] = fuel_required[i] * fuel_cost_per_liter
+            cost_per_hectare[i] = total_cost[i] / target_hectares
+        else:
+            # What's achievable in a full day
+            can_complete[i] = False
+            time_required[i] = working_hours
+            fuel_required[i] = fuel_rate * daily
+            total_cost[i] = fuel_required[i] * fuel_cost_per_liter
+            cost_per_hectare[i] = total_cost[i] / daily if daily > 0 else 0.0
+        
+        total_hourly_capacity[i] = hourly
+        total_daily_capacity[i] = daily
+        fuel_per_hectare[i] = fuel_rate
+    
+    return (can_complete, time_required, fuel_required, total_cost, cost_per_hectare,
+            total_hourly_capacity, total_daily_capacity, fuel_per_hectare)
+
+@st.cache_resource(show_spinner=False)
+def _sweep_kernels(kernel_source):
+    """
+    Serial and multi-threaded compiled builds of _sweep_metrics.
+    
+    Streamlit re-executes this script on every rerun, so the dispatchers are
+    held as a cached resource to keep their compiled code across reruns.
+    The cache key covers only this factory's own source and its arguments,
+    so callers pass the kernel's source as kernel_source; editing
+    _sweep_metrics under hot reload then compiles fresh kernels.
+    Numba's on-disk cache is not used: it records the importing module's name
+    and fails when the file is loaded under another one (e.g. `streamlit run`
+    vs. `scripts.optimization` in the tests). fastmath is left off so the
+    compiled results match the plain-Python path used for short sweeps.
+    numba is imported here so only the compiled path pays for loading it.
+    """
+    global prange
+    import numba
+    prange = numba.prange
+    return (numba.njit(_sweep_metrics),
+            numba.njit(parallel=True)(_sweep_metrics))
+
+# Sweeps shorter than this run as plain Python, which beats a cold JIT compile
+# for the few points the closed-form path evaluates
+_COMPILED_SWEEP_MIN = 16
+
+# Sweeps longer than this are split across threads; below it thread start-up
+# costs more than the loop itself
+_PARALLEL_SWEEP_MIN = 256
+
+@functools.lru_cache(maxsize=32)
+def _speed_grid(min_speed, max_speed, n_speeds):
+    """Speed grid for a full sweep; shared read-only since the range rarely changes."""
+    speeds = np.linspace(min_speed, max_speed, n_speeds)
+    speeds.setflags(write=False)
+    return speeds
+
+@st.cache_data(max_entries=128, show_spinner=False)
 def find_optimal_speed(target_hectares, tractor_count, min_speed, max_speed, 
                       working_hours, implement_width, field_efficiency, 
-                      fuel_cost_per_liter, operation_type, speed_increment=0.1):
+                      fuel_cost_per_liter, operation_type, speed_increment=0.1,
+                      full_sweep=False):
     """
     Find the optimal speed to complete target_hectares at minimum cost.
     All tractors work together to cover the target area.
+    
+    Args:
+        full_sweep: Evaluate every speed in the grid instead of only the optimum
+    
+    Returns:
+        SweepResult holding the metrics for the optimal speed (or max_speed
+        when infeasible), or for every speed in the grid if full_sweep is set
+    
+    Raises:
+        ValueError: If min_speed is greater than max_speed
     """
-    speeds = np.arange(min_speed, max_speed + speed_increment, speed_increment)
-    all_results = []
-    
-    for speed in speeds:
-        # Calculate capacity metrics
-        hourly_capacity_per_tractor = (speed * implement_width * field_efficiency) / 10
-        total_hourly_capacity = hourly_capacity_per_tractor * tractor_count
-        total_daily_capacity = total_hourly_capacity * working_hours
-        
-        # Fuel consumption rate at this speed for this operation
-        fuel_per_hectare = calculate_fuel_consumption(operation_type, speed)
-        
-        # Can we complete the target area?
-        can_complete = total_daily_capacity >= target_hectares
-        
-        if can_complete:
-            # Calculate actual time and fuel needed for target area
-            time_required = target_hectares / total_hourly_capacity
-            
-            # Fuel for covering target_hectares
-            fuel_required = fuel_per_hectare * target_hectares
-            total_cost = fuel_required * fuel_cost_per_liter
-            cost_per_hectare = total_cost / target_hectares
-            
-            results = {
-                "speed": speed,
-                "can_complete": True,
-                "time_required_hours": time_required,
-                "fuel_required": fuel_required,
-                "total_cost": total_cost,
-                "cost_per_hectare": cost_per_hectare,
-                "total_hourly_capacity": total_hourly_capacity,
-                "total_daily_capacity": total_daily_capacity,
-                "fuel_per_hectare": fuel_per_hectare
-            }
+    if min_speed > max_speed:
+        raise ValueError(
+            f"Minimum speed ({min_speed} km/hr) cannot exceed maximum speed ({max_speed} km/hr)."
+        )
+    
+    base_consumption, reference_speed = _OP_PARAMS[operation_type]
+    capacity_coeff = _capacity_coeff(implement_width, field_efficiency)
+    
+    # linspace hits both endpoints exactly; a float-step arange can gain or lose one.
+    # An increment wider than the range still keeps max_speed on the grid.
+    n_speeds = int(round((max_speed - min_speed) / speed_increment)) + 1
+    if max_speed > min_speed:
+        n_speeds = max(n_speeds, 2)
+    
+    if full_sweep:
+        speeds = _speed_grid(min_speed, max_speed, n_speeds)
+    else:
+        # Cost for the target area rises with speed while capacity rises linearly,
+        # so the optimum is the slowest grid speed that covers the target in a day.
+        # Locate it in closed form and evaluate only its neighbours, which absorbs
+        # rounding right at the feasibility boundary.
+        last = n_speeds - 1
+        step = (max_speed - min_speed) / last if last > 0 else 0.0
+        # Fleet area covered in a day per km/hr of speed; with no capacity at
+        # all, jump straight to max_speed so the infeasible path reports it
+        daily_capacity_per_speed = capacity_coeff * tractor_count * working_hours
+        if daily_capacity_per_speed <= 0:
+            k = last
         else:
-            # Can't complete target - show what's achievable in a full day
-            time_required = working_hours
-            fuel_required = fuel_per_hectare * total_daily_capacity
-            total_cost = fuel_required * fuel_cost_per_liter
-            cost_per_hectare = total_cost / total_daily_capacity if total_daily_capacity > 0 else 0
-            
-            results = {
-                "speed": speed,
-                "can_complete": False,
-                "time_required_hours": time_required,
-                "fuel_required": fuel_required,
-                "total_cost": total_cost,
-                "cost_per_hectare": cost_per_hectare,
-                "total_hourly_capacity": total_hourly_capacity,
-                "total_daily_capacity": total_daily_capacity,
-                "fuel_per_hectare": fuel_per_hectare,
-                "area_achievable": total_daily_capacity
-            }
-            
-        all_results.append(results)
-    
-    results_df = pd.DataFrame(all_results)
-    feasible = results_df[results_df["can_complete"]]
-    
-    if len(feasible) > 0:
-        optimal = feasible.loc[feasible["total_cost"].idxmin()]
+            speed_needed = target_hectares / daily_capacity_per_speed
+            k = math.ceil((speed_needed - min_speed) / step) if step > 0 else 0
+        k = min(max(k, 0), last)
+        # Same grid points np.linspace(min_speed, max_speed, n_speeds) would produce
+        speeds = np.array([
+            max_speed if i == last and last > 0 else min_speed + i * step
+            for i in range(max(k - 1, 0), min(k + 2, n_speeds))
+        ])
+    
+    if len(speeds) < _COMPILED_SWEEP_MIN:
+        kernel = _sweep_metrics
+    else:
+        serial_kernel, parallel_kernel = _sweep_kernels(inspect.getsource(_sweep_metrics))
+        kernel = parallel_kernel if len(speeds) > _PARALLEL_SWEEP_MIN else serial_kernel
+    metrics = kernel(
+        speeds, float(base_consumption), float(reference_speed), float(tractor_count),
+        float(working_hours), float(capacity_coeff),
+        float(target_hectares), float(fuel_cost_per_liter)
+    )
+    total_daily_capacity = metrics[6]
+    
+    # Daily capacity rises with speed, so the feasible speeds are a suffix of the
+    # grid and the first of them is also the cheapest
+    optimal_idx = int(np.searchsorted(total_daily_capacity, target_hectares, side="left"))
+    if optimal_idx < len(speeds):
         status = "optimal"
     else:
-        optimal = results_df.iloc[-1]
         status = "infeasible"
-        
-    return {
-        "status": status,
-        "optimal_speed": optimal["speed"] if status == "optimal" else None,
-        "optimal_metrics": optimal.to_dict() if status == "optimal" else None,
-        "all_results": results_df
-    }
+        optimal_idx = len(speeds) - 1
+    
+    if not full_sweep:
+        # Keep only the reported speed: the optimum, or max_speed when infeasible
+        return SweepResult(status, 0, *(values[optimal_idx:optimal_idx + 1] for values in (speeds, *metrics)))
+    
+    return SweepResult(status, optimal_idx, speeds, *metrics)
 
+@st.cache_data(max_entries=128, show_spinner=False)
 def calculate_tractors_for_speed(target_hectares, desired_speed, working_hours, 
                                 implement_width, field_efficiency, fuel_cost_per_liter,
                                 operation_type):
     """
     Calculate the minimum number of tractors needed to cover target area at a given speed.
+    
+    desired_speed may be a scalar or an array of speeds; array input returns a
+    dictionary of arrays, scalar input a dictionary of scalars.
     """
-    hourly_capacity_per_tractor = (desired_speed * implement_width * field_efficiency) / 10
+    speeds = np.asarray(desired_speed, dtype=np.float64)
+    hourly_capacity_per_tractor = speeds * _capacity_coeff(implement_width, field_efficiency)
     daily_capacity_per_tractor = hourly_capacity_per_tractor * working_hours
     
-    # Minimum tractors needed
-    tractors_needed = np.ceil(target_hectares / daily_capacity_per_tractor) if daily_capacity_per_tractor > 0 else 0
-    
-    # Actual time required with this many tractors
-    total_hourly_capacity = hourly_capacity_per_tractor * tractors_needed
-    time_required = target_hectares / total_hourly_capacity if total_hourly_capacity > 0 else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Minimum tractors needed
+        tractors_needed = np.where(
+            daily_capacity_per_tractor > 0,
+            np.ceil(target_hectares / daily_capacity_per_tractor),
+            0
+        ).astype(np.int64)
+        
+        # Actual time required with this many tractors
+        total_hourly_capacity = hourly_capacity_per_tractor * tractors_needed
+        time_required = np.where(total_hourly_capacity > 0, target_hectares / total_hourly_capacity, 0.0)
     
     # Fuel calculation based on operation type
-    fuel_per_hectare = calculate_fuel_consumption(operation_type, desired_speed)
+    base_consumption, reference_speed = _OP_PARAMS[operation_type]
+    speed_ratio = speeds / reference_speed
+    fuel_per_hectare = base_consumption * speed_ratio * np.sqrt(speed_ratio)
     fuel_required = fuel_per_hectare * target_hectares
     total_fuel_cost = fuel_required * fuel_cost_per_liter
     
-    return {
-        "tractors_needed": int(tractors_needed),
+    results = {
+        "tractors_needed": tractors_needed,
         "fuel_required": fuel_required,
         "time_required": time_required,
         "total_fuel_cost": total_fuel_cost,
@@ -234,6 +433,17 @@ def calculate_tractors_for_speed(target_hectares, desired_speed, working_hours,
         "hourly_capacity_per_tractor": hourly_capacity_per_tractor,
         "total_hourly_capacity": total_hourly_capacity
     }
+    if speeds.ndim == 0:
+        return {name: value.item() for name, value in results.items()}
+    return results
+
+def _metrics_table(metrics):
+    """
+    Render (label, value) pairs as a single markdown table, so a block of
+    results reaches the browser as one element instead of one per metric.
+    """
+    rows = [f"| {label} | {value} |" for label, value in metrics]
+    return "\n".join(["| Metric | Value |", "| --- | --- |", *rows])
 
 # Streamlit UI
 def main():
@@ -251,10 +461,7 @@ def main():
     
     # Show fuel consumption range for selected operation
     op_data = OPERATION_FUEL_DATA[operation_type]
-    st.sidebar.info(f"📊 **Fuel range:** {op_data['range']} L/ha\n\n"
-                   f"⚙️ **Reference speed:** {op_data['reference_speed']} km/hr\n\n"
-                   f"🎯 **Recommended speed:** {op_data['speed_range']} km/hr\n\n"
-                   f"💡 *{op_data['remarks']}*")
+    st.sidebar.info(_OP_INFO_STRINGS[operation_type])
     
     tractor_count = st.sidebar.number_input("Number of tractors", min_value=1, max_value=10, value=5)
     target_hectares = st.sidebar.number_input("Target area to cover (hectares)", min_value=1.0, max_value=100.0, value=15.0)
@@ -271,26 +478,29 @@ def main():
         max_speed = st.number_input("Maximum speed (km/hr)", min_value=1.0, max_value=15.0, value=10.0)
     
     # Run optimization
-    result = find_optimal_speed(
-        target_hectares, tractor_count, min_speed, max_speed,
-        working_hours, implement_width, field_efficiency, fuel_cost, operation_type
-    )
+    try:
+        result = find_optimal_speed(
+            target_hectares, tractor_count, min_speed, max_speed,
+            working_hours, implement_width, field_efficiency, fuel_cost, operation_type
+        )
+    except ValueError as err:
+        result, range_error = None, err
     
     st.header("Optimization Results")
-    if result["status"] == "optimal":
-        optimal = result["optimal_metrics"]
+    if result is None:
+        st.error(f"❌ {range_error}")
+    elif result.status == "optimal":
+        optimal = result.optimal_metrics
         st.success(f"✅ Optimal solution found for {operation_type}!")
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Optimal Speed", f"{optimal['speed']:.1f} km/hr")
-            st.metric("Time Required", f"{optimal['time_required_hours']:.2f} hrs")
-        with col2:
-            st.metric("Total Fuel", f"{optimal['fuel_required']:.2f} L")
-            st.metric("Fuel Rate", f"{optimal['fuel_per_hectare']:.2f} L/ha")
-        with col3:
-            st.metric("Total Cost", f"₦{optimal['total_cost']:,.2f}")
-            st.metric("Cost per Hectare", f"₦{optimal['cost_per_hectare']:,.2f}")
+        st.markdown(_metrics_table([
+            ("Optimal Speed", f"{optimal['speed']:.1f} km/hr"),
+            ("Time Required", f"{optimal['time_required_hours']:.2f} hrs"),
+            ("Total Fuel", f"{optimal['fuel_required']:.2f} L"),
+            ("Fuel Rate", f"{optimal['fuel_per_hectare']:.2f} L/ha"),
+            ("Total Cost", f"₦{optimal['total_cost']:,.2f}"),
+            ("Cost per Hectare", f"₦{optimal['cost_per_hectare']:,.2f}")
+        ]))
         
         st.info(f"📊 **Capacity:** {optimal['total_hourly_capacity']:.2f} ha/hr with {tractor_count} tractors")
         
@@ -317,15 +527,14 @@ def main():
         )
         
         st.write("### Results")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("🔢 Tractors Needed", f"{custom_results['tractors_needed']}")
-            st.metric("⏳ Time Required", f"{custom_results['time_required']:.2f} hrs")
-            st.metric("🚜 Capacity per Tractor", f"{custom_results['hourly_capacity_per_tractor']:.2f} ha/hr")
-        with col2:
-            st.metric("⛽ Fuel Rate", f"{custom_results['fuel_per_hectare']:.2f} L/ha")
-            st.metric("⛽ Total Fuel", f"{custom_results['fuel_required']:.2f} L")
-            st.metric("💰 Total Cost", f"₦{custom_results['total_fuel_cost']:,.2f}")
+        st.markdown(_metrics_table([
+            ("🔢 Tractors Needed", f"{custom_results['tractors_needed']}"),
+            ("⏳ Time Required", f"{custom_results['time_required']:.2f} hrs"),
+            ("🚜 Capacity per Tractor", f"{custom_results['hourly_capacity_per_tractor']:.2f} ha/hr"),
+            ("⛽ Fuel Rate", f"{custom_results['fuel_per_hectare']:.2f} L/ha"),
+            ("⛽ Total Fuel", f"{custom_results['fuel_required']:.2f} L"),
+            ("💰 Total Cost", f"₦{custom_results['total_fuel_cost']:,.2f}")
+        ]))
         
         st.info(f"📊 **Combined Capacity:** {custom_results['total_hourly_capacity']:.2f} ha/hr with {custom_results['tractors_needed']} tractors")
         
@@ -336,18 +545,7 @@ def main():
     
     # Show operation fuel data table
     with st.expander("📋 View All Operation Fuel Consumption Data"):
-        fuel_df = pd.DataFrame([
-            {
-                "Operation": op,
-                "Fuel Range (L/ha)": data["range"],
-                "Base (L/ha)": data["base"],
-                "Reference Speed (km/h)": data["reference_speed"],
-                "Typical Speed Range (km/h)": data["speed_range"],
-                "Remarks": data["remarks"]
-            }
-            for op, data in OPERATION_FUEL_DATA.items()
-        ])
-        st.dataframe(fuel_df, use_container_width=True, hide_index=True)
+        st.dataframe(_fuel_table(), use_container_width=True, hide_index=True)
 
 if __name__ == "__main__":
     main()
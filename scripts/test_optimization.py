@@ -1,14 +1,84 @@
-from optimization import create_optimization_model
+import numpy as np
+import pytest
+
+from scripts.optimization import calculate_tractors_for_speed, find_optimal_speed
+
+FARM = dict(working_hours=8.0, implement_width=1.8, field_efficiency=0.75,
+            fuel_cost_per_liter=1379.0, operation_type="Ploughing (Moldboard/Disc)")
 
 def test_optimization():
-    model = create_optimization_model()
-    model.solve()  # Solve the optimization problem
+    result = find_optimal_speed(15.0, 5, 3.0, 10.0, **FARM)
+    sweep = find_optimal_speed(15.0, 5, 3.0, 10.0, **FARM, full_sweep=True)
+
+    assert result.status == "optimal"
+    assert result.optimal_metrics == sweep.optimal_metrics
+    assert sweep.total_daily_capacity[sweep.optimal_idx] >= 15.0
+    assert not sweep.can_complete[:sweep.optimal_idx].any()
+
+def test_optimization_parallel_sweep():
+    # 701 speeds is past the threshold for the multi-threaded kernel
+    result = find_optimal_speed(15.0, 5, 3.0, 10.0, **FARM, speed_increment=0.01)
+    sweep = find_optimal_speed(15.0, 5, 3.0, 10.0, **FARM, speed_increment=0.01, full_sweep=True)
+
+    assert len(sweep.speeds) == 701
+    assert result.optimal_metrics == sweep.optimal_metrics
+
+def test_optimization_infeasible():
+    result = find_optimal_speed(100.0, 1, 3.0, 10.0, **FARM)
+
+    assert result.status == "infeasible"
+    assert result.optimal_speed is None
+    assert result.speeds[0] == 10.0
+
+@pytest.mark.parametrize("tractor_count, hours, width",
+                         [(0, 8.0, 1.8), (5, 0.0, 1.8), (5, 8.0, 0.0)])
+def test_optimization_zero_capacity(tractor_count, hours, width):
+    farm = dict(FARM, working_hours=hours, implement_width=width)
+    result = find_optimal_speed(15.0, tractor_count, 3.0, 10.0, **farm)
+
+    assert result.status == "infeasible"
+    assert result.speeds[0] == 10.0
+
+@pytest.mark.parametrize("full_sweep", [False, True])
+def test_optimization_reversed_speed_range(full_sweep):
+    with pytest.raises(ValueError, match="Minimum speed"):
+        find_optimal_speed(15.0, 5, 10.0, 3.0, **FARM, full_sweep=full_sweep)
+
+def test_optimization_coarse_increment():
+    # An increment wider than the range must still evaluate max_speed
+    result = find_optimal_speed(23.0, 5, 4.0, 4.5, **FARM, speed_increment=1.0)
+    sweep = find_optimal_speed(23.0, 5, 4.0, 4.5, **FARM, speed_increment=1.0, full_sweep=True)
+
+    assert result.status == "optimal"
+    assert result.optimal_speed == 4.5
+    assert list(sweep.speeds) == [4.0, 4.5]
+
+def test_sweep_to_dataframe():
+    sweep = find_optimal_speed(15.0, 5, 1.0, 10.0, **FARM, full_sweep=True)
+    df = sweep.to_dataframe()
+
+    assert len(df.columns) == 10
+    assert len(df) == len(sweep.speeds)
+    feasible = df[df["can_complete"]]
+    infeasible = df[~df["can_complete"]]
+    assert len(feasible) > 0 and len(infeasible) > 0
+    assert feasible["area_achievable"].isna().all()
+    assert (infeasible["area_achievable"] == infeasible["total_daily_capacity"]).all()
+
+def test_tractors_for_speed():
+    custom = calculate_tractors_for_speed(15.0, 5.0, **FARM)
+
+    assert custom["tractors_needed"] == 3
+    assert custom["fuel_per_hectare"] == 35.0
+    assert custom["time_required"] <= FARM["working_hours"]
 
-    # Print results
-    print("\nTest Results:")
-    for var in model.variables():
-        print(f"{var.name}: {var.varValue}")
-    print(f"Objective Value: {model.objective.value()}")
+def test_tractors_for_speed_array():
+    speeds = np.array([0.0, 5.0, 10.0])
+    custom = calculate_tractors_for_speed(15.0, speeds, **FARM)
+    scalar = [calculate_tractors_for_speed(15.0, speed, **FARM) for speed in speeds]
 
-if __name__ == "__main__":
-    test_optimization()
+    assert list(custom["tractors_needed"]) == [0, 3, 2]
+    assert custom["time_required"][0] == 0.0
+    for i, expected in enumerate(scalar):
+        for name, value in expected.items():
+            assert np.isclose(custom[name][i], value)